@@ -1,23 +1,25 @@
-from typing import List
+import numpy as np
+
 from qplex import QModel
 from qplex.model.options import Options
 
 
-def model_knapsack_problem(values: List, weights: List, const: int) -> QModel:
+def model_knapsack_problem(values: np.ndarray, weights: np.ndarray,
+                           const: int) -> QModel:
     n_items = len(values)
     knapsack_model = QModel('knapsack')
     x = knapsack_model.binary_var_list(n_items, name="x")
     knapsack_model.add_constraint(
-        sum(weights[i] * x[i] for i in range(n_items)) <= const)
-    obj_fn = sum(values[i] * x[i] for i in range(n_items))
+        knapsack_model.scal_prod(x, weights) <= const)
+    obj_fn = knapsack_model.scal_prod(x, values)
     knapsack_model.set_objective('max', obj_fn)
 
     return knapsack_model
 
 
 def main():
-    values = [10, 5, 18, 12, 15, 1, 2, 8]
-    weights = [4, 2, 5, 4, 5, 1, 3, 5]
+    values = np.asarray([10, 5, 18, 12, 15, 1, 2, 8], dtype=np.int64)
+    weights = np.asarray([4, 2, 5, 4, 5, 1, 3, 5], dtype=np.int64)
     const = 15
 
     knapsack_model = model_knapsack_problem(values, weights, const)
@@ -12,23 +12,18 @@ def model_max_cut_problem() -> QModel:
              (1, 2, 4.0), (1, 3, 1.0), (1, 4, 1.0),
              (1, 5, 3.0), (2, 4, 2.0), (2, 5, 3.0), (3, 4, 5.0), (3, 5, 1.0)]
     graph.add_weighted_edges_from(edges)
-    weight_matrix = nx.adjacency_matrix(graph)
-    shape = weight_matrix.shape
-    size = shape[0]
-    qubo_matrix = np.zeros((size, size))
-    qubo_vector = np.zeros(size)
-    for i in range(size):
-        for j in range(size):
-            qubo_matrix[i, j] -= weight_matrix[i, j]
-    for i in range(size):
-        for j in range(size):
-            qubo_vector[i] += weight_matrix[i, j]
+    weight_matrix = nx.to_scipy_sparse_array(graph, format='coo')
+    size = weight_matrix.shape[0]
+    qubo_vector = np.asarray(weight_matrix.sum(axis=1)).ravel()
     model = QModel('max_cut')
-    x = model.binary_var_list(6, name="x")
-    linear_terms = sum(qubo_vector[i] * x[i] for i in range(size))
-    quadratic_terms = sum(
-        qubo_matrix[i][j] * x[i] * x[j] for i in range(size) for j in
-        range(size))
+    x = model.binary_var_list(size, name="x")
+    linear_terms = model.scal_prod(x, qubo_vector)
+    # The matrix is symmetric, so each edge is added once with a doubled
+    # coefficient instead of once per (i, j) and (j, i).
+    quadratic_terms = model.sum(
+        -2 * w * x[i] * x[j]
+        for i, j, w in zip(weight_matrix.row, weight_matrix.col,
+                           weight_matrix.data) if i < j)
     obj_fn = linear_terms + quadratic_terms
     model.set_objective('max', obj_fn)
 
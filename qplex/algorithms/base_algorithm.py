@@ -1,7 +1,10 @@
+import warnings
 from abc import ABC, abstractmethod
 from qiskit_optimization import QuadraticProgram
 import numpy as np
 
+from qplex.commons.circuit_utils import (remove_input_declarations,
+                                         replace_params)
 from qplex.solvers.base_solver import Solver
 
 
@@ -32,6 +35,12 @@ class Algorithm(ABC):
         method in the subclass.
     """
 
+    __slots__ = ('model', '_qubo', 'iteration', 'circuit', '_objective_terms',
+                 '_energy_cache')
+
+    # Maximum number of memoized bitstring energies kept per instance
+    ENERGY_CACHE_SIZE = 2 ** 16
+
     def __init__(self, model):
         """
         Initializes the Algorithm with the provided optimization model.
@@ -43,10 +52,27 @@ class Algorithm(ABC):
             of QModel or similar.
         """
         self.model = model
-        self.qubo: QuadraticProgram | None = None  # Holds the QUBO encoding
-        self.iteration = 0  # Tracks the current iteration of the optimization
+        self.qubo = None  # Holds the QUBO encoding
+        self.iteration = 0  # Counts cost evaluations across all restarts
         self.circuit = None  # Quantum circuit string, initialized as None
 
+    @property
+    def qubo(self) -> QuadraticProgram | None:
+        """
+        The QUBO encoding of the problem.
+
+        Assigning a new encoding (e.g., when `create_circuit` is called
+        again with a different penalty) discards the cached objective terms
+        and bitstring energies, which were derived from the previous one.
+        """
+        return self._qubo
+
+    @qubo.setter
+    def qubo(self, qubo: QuadraticProgram | None):
+        self._qubo = qubo
+        self._objective_terms = None  # Cached NumPy view of the QUBO
+        self._energy_cache = {}  # Bitstring -> energy, kept across iterations
+
     @abstractmethod
     def create_circuit(self) -> str:
         """
@@ -64,14 +90,16 @@ class Algorithm(ABC):
         """
         ...
 
-    @abstractmethod
     def update_params(self, params: np.ndarray) -> str:
         """
-        Updates the parameters of the quantum circuit.
+        Returns the quantum circuit with the given parameters bound.
 
-        This method updates the circuit's gates according to new parameters,
-        often used in variational quantum algorithms where parameters are
-        iteratively optimized.
+        The parameter input declarations are dropped and every 'thetaX'
+        placeholder is replaced by its value, which is the same binding
+        `Solver.solve_parameterized` applies by default. The workflows do
+        not call this method; they pass the parameterized circuit to
+        `Solver.solve_parameterized`. It is kept for callers that need the
+        bound OpenQASM3 text itself.
 
         Parameters
         ----------
@@ -84,7 +112,7 @@ class Algorithm(ABC):
         str
             The updated OpenQASM3 string with the new parameter values.
         """
-        ...
+        return replace_params(remove_input_declarations(self.circuit), params)
 
     @abstractmethod
     def get_starting_point(self) -> np.ndarray:
@@ -109,10 +137,14 @@ class Algorithm(ABC):
 
         This method removes lines in the circuit string that declare
         parameter inputs (i.e., `input float[64] thetaX;`) but keeps the
-        placeholders (like 'thetaX') in the circuit. This is useful for
-        working with unparameterized circuits or circuits where parameters
-        are defined externally, such as when using the GGAE workflow from
-        QPLEX.
+        placeholders (like 'thetaX') in the circuit.
+
+        .. deprecated:: 0.1.0
+            The workflows no longer call this method. Solvers bind the
+            parameters through `Solver.solve_parameterized`, and their
+            compiled paths need the input declarations, so stripping them
+            from `circuit` is no longer required. Use `update_params` to
+            get the bound circuit text.
 
         Raises
         ------
@@ -124,9 +156,84 @@ class Algorithm(ABC):
                 "The 'circuit' attribute is not defined. Ensure the circuit "
                 "is instantiated in the specific algorithm.")
 
-        lines = self.circuit.splitlines()
+        warnings.warn("Algorithm.remove_parameters is deprecated; "
+                      "parameters are bound by Solver.solve_parameterized.",
+                      DeprecationWarning, stacklevel=2)
+        self.circuit = remove_input_declarations(self.circuit)
+
+    def get_objective_terms(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Returns the QUBO objective as dense NumPy terms.
 
-        filtered_lines = [line for line in lines if
-                          not line.startswith("input float[64]")]
+        The linear vector, quadratic matrix and constant offset are
+        extracted from the QUBO the first time this method is called and
+        cached, so repeated energy evaluations during the optimization do
+        not go through the qiskit_optimization expression objects. When
+        all coefficients are small integers the arrays are stored in single
+        precision, which halves their footprint without changing any
+        energy.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, float]
+            The linear coefficients, the quadratic coefficient matrix and
+            the constant of the QUBO objective.
 
-        self.circuit = "\n".join(filtered_lines)
+        Raises
+        ------
+        AttributeError
+            If the 'qubo' attribute has not been built yet.
+        """
+        if self._objective_terms is None:
+            if self.qubo is None:
+                raise AttributeError(
+                    "The 'qubo' attribute is not defined. Ensure the circuit "
+                    "is created before evaluating the objective.")
+            objective = self.qubo.objective
+            linear = objective.linear.to_array()
+            quadratic = objective.quadratic.to_array()
+            constant = objective.constant
+            # Integer coefficients whose magnitudes add up to less than
+            # 2**24 keep every energy exact in single precision.
+            coefficients = np.concatenate(
+                (linear, quadratic.ravel(), [constant]))
+            if np.all(np.mod(coefficients, 1) == 0) and \
+                    np.abs(coefficients).sum() < 2 ** 24:
+                linear = linear.astype(np.float32)
+                quadratic = quadratic.astype(np.float32)
+            self._objective_terms = (linear, quadratic, constant)
+        return self._objective_terms
+
+    def get_sample_energies(self, samples: list[str]) -> np.ndarray:
+        """
+        Returns the QUBO energy of each measured bitstring.
+
+        Energies are memoized by bitstring, since the same samples keep
+        reappearing from one optimization iteration to the next. Only the
+        bitstrings that have not been seen before are decoded and evaluated,
+        in a single vectorized pass over the cached objective terms.
+
+        Parameters
+        ----------
+        samples : list[str]
+            The measured bitstrings (strings of 0s and 1s).
+
+        Returns
+        -------
+        np.ndarray
+            The energy of each bitstring, in the same order as `samples`.
+        """
+        cache = self._energy_cache
+        missing = [sample for sample in samples if sample not in cache]
+        if missing:
+            if len(cache) + len(missing) > self.ENERGY_CACHE_SIZE:
+                cache = self._energy_cache = {}
+            linear, quadratic, constant = self.get_objective_terms()
+            bits = np.frombuffer("".join(missing).encode("ascii"),
+                                 dtype=np.uint8).reshape(len(missing), -1)
+            bits = (bits - ord("0")).astype(quadratic.dtype)
+            energies = (((bits @ quadratic) * bits).sum(axis=1) +
+                        bits @ linear + constant)
+            cache.update(zip(missing, energies.tolist()))
+        return np.fromiter((cache[sample] for sample in samples),
+                           dtype=np.float64, count=len(samples))
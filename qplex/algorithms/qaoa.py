@@ -1,7 +1,14 @@
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 
 from qplex.algorithms.base_algorithm import Algorithm
-from qplex.commons.circuit_utils import replace_params
+
+# Generated circuits keyed by (p, n, digest of the QUBO coefficients), least
+# recently used first
+_CIRCUIT_CACHE = OrderedDict()
+_CIRCUIT_CACHE_SIZE = 32
 
 
 class QAOA(Algorithm):
@@ -27,6 +34,8 @@ class QAOA(Algorithm):
         equal to 2 times the number of repetitions (p).
     """
 
+    __slots__ = ('p', 'n', 'num_params', '_rng')
+
     def __init__(self, model, p: int, seed: int, penalty: float):
         """
         Initializes the QAOA algorithm with the given parameters.
@@ -50,7 +59,7 @@ class QAOA(Algorithm):
         self.n: int = 0
         self.num_params = 2 * self.p
         self.circuit: str = self.create_circuit(penalty=penalty)
-        np.random.seed(seed)
+        self._rng = np.random.default_rng(seed)
 
     def create_circuit(self, *args, **kwargs) -> str:
         """
@@ -77,61 +86,91 @@ class QAOA(Algorithm):
         self.qubo = self.model.get_qubo(penalty=kwargs['penalty'])
         self.n = self.qubo.get_num_binary_vars()
 
-        circuit_lines = [f"input float[64] theta{i};" for i in range(self.num_params)]
+        linear_terms = np.asarray(self.qubo.objective.linear.to_array(),
+                                  dtype=np.float64)
+        quadratic_terms = np.asarray(
+            self.qubo.objective.quadratic.to_array(), dtype=np.float64)
+
+        # The circuit only depends on the number of layers and the QUBO
+        # coefficients, so repeated instances for the same problem reuse
+        # it. The key holds a fixed-size digest of the coefficients rather
+        # than the coefficients themselves.
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(linear_terms.tobytes())
+        digest.update(quadratic_terms.tobytes())
+        key = (self.p, self.n, digest.digest())
+
+        circuit = _CIRCUIT_CACHE.get(key)
+        if circuit is None:
+            circuit = self._build_circuit(self.p, linear_terms,
+                                          quadratic_terms)
+            _CIRCUIT_CACHE[key] = circuit
+            if len(_CIRCUIT_CACHE) > _CIRCUIT_CACHE_SIZE:
+                _CIRCUIT_CACHE.popitem(last=False)
+        else:
+            _CIRCUIT_CACHE.move_to_end(key)
+        return circuit
+
+    @staticmethod
+    def _build_circuit(p: int, linear_terms: np.ndarray,
+                       quadratic_terms: np.ndarray) -> str:
+        """
+        Builds the OpenQASM3 string of a QAOA circuit.
 
-        circuit_lines.extend([f"qreg q[{self.n}];", f"creg c[{self.n}];"])
+        Parameters
+        ----------
+        p : int
+            The number of QAOA layers.
+        linear_terms : np.ndarray
+            The linear QUBO coefficients.
+        quadratic_terms : np.ndarray
+            The quadratic QUBO coefficient matrix.
 
-        circuit_lines.extend([f"h q[{i}];" for i in range(self.n)])
+        Returns
+        -------
+        str
+            An OpenQASM3 string representing the quantum circuit for
+            QAOA.
+        """
+        n = linear_terms.size
 
-        linear_terms = self.qubo.objective.linear.to_array()
-        quadratic_terms = self.qubo.objective.quadratic.to_array()
+        circuit_lines = [f"input float[64] theta{i};" for i in range(2 * p)]
 
-        for idx in range(self.p):
-            theta_2idx = f"theta{2 * idx}"
-            theta_2idx_plus_1 = f"theta{2 * idx + 1}"
+        circuit_lines.extend([f"qreg q[{n}];", f"creg c[{n}];"])
 
-            for i, w in enumerate(linear_terms):
-                h_sum = sum(quadratic_terms[i])
-                circuit_lines.append(
-                    f"rz({theta_2idx} * {(w + h_sum)}) q[{i}];")
+        circuit_lines.extend([f"h q[{i}];" for i in range(n)])
 
-            for i in range(self.n):
-                for j in range(i + 1, self.n):
-                    w = quadratic_terms[i, j]
-                    if w != 0:
-                        circuit_lines.append(f"cx q[{i}], q[{j}];")
-                        circuit_lines.append(f"rz({theta_2idx} * {w / 2}) q[{j}];")
-                        circuit_lines.append(f"cx q[{i}], q[{j}];")
+        rz_weights = (linear_terms + quadratic_terms.sum(axis=1)).tolist()
 
-            for i in range(self.n):
-                circuit_lines.append(f"rx(2 * {theta_2idx_plus_1}) q[{i}];")
+        rows, cols = np.triu_indices(n, k=1)
+        weights = quadratic_terms[rows, cols]
+        nonzero = weights != 0
+        couplings = list(zip(rows[nonzero].tolist(), cols[nonzero].tolist(),
+                             (weights[nonzero] / 2).tolist()))
 
-        circuit_lines.extend([f"measure q[{i}] -> c[{i}];" for i in range(self.n)])
+        # Every layer has the same gates and only differs in the names of
+        # its two angles, so the layer is built once and formatted p times.
+        layer_lines = [f"rz(%(gamma)s * {w}) q[{i}];"
+                       for i, w in enumerate(rz_weights) if w != 0]
 
-        return "\n".join(circuit_lines)
+        for i, j, w in couplings:
+            layer_lines.append(f"cx q[{i}], q[{j}];")
+            layer_lines.append(f"rz(%(gamma)s * {w}) q[{j}];")
+            layer_lines.append(f"cx q[{i}], q[{j}];")
 
-    def update_params(self, params: np.ndarray) -> str:
-        """
-        Updates the parameters of the QAOA circuit.
+        layer_lines.extend(
+            [f"rx(2 * %(beta)s) q[{i}];" for i in range(n)])
 
-        The circuit is updated by replacing the placeholder angles ('thetaX')
-        with the values provided in the parameter array. This allows the
-        quantum circuit to be re-parameterized as part of a variational
-        optimization process.
+        layer_template = "\n".join(layer_lines)
 
-        Parameters
-        ----------
-        params : np.ndarray
-            The new set of parameters for the QAOA circuit, typically representing
-            rotation angles in the circuit's gates.
+        for idx in range(p):
+            circuit_lines.append(layer_template % {
+                'gamma': f"theta{2 * idx}",
+                'beta': f"theta{2 * idx + 1}"})
 
-        Returns
-        -------
-        str
-            The updated OpenQASM3 string for the QAOA circuit with the new
-            parameter values.
-        """
-        return replace_params(self.circuit, params)
+        circuit_lines.append("c = measure q;")
+
+        return "\n".join(circuit_lines)
 
     def get_starting_point(self) -> np.ndarray:
         """
@@ -146,4 +185,4 @@ class QAOA(Algorithm):
             An array representing the starting point for QAOA, initialized
             with random values between 0 and 1.
         """
-        return np.random.rand(2 * self.p)
\ No newline at end of file
+        return self._rng.random(self.num_params)
\ No newline at end of file
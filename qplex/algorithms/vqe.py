@@ -1,7 +1,13 @@
 import numpy as np
 
 from qplex.algorithms.base_algorithm import Algorithm
-from qplex.commons.circuit_utils import replace_params
+
+_PAIR_TEMPLATE = ("cx q[{a}], q[{b}];\n"
+                  "ry(theta{p0}) q[{a}];\n"
+                  "ry(theta{p1}) q[{b}];\n"
+                  "cx q[{a}], q[{b}];\n"
+                  "ry(theta{p2}) q[{a}];\n"
+                  "ry(theta{p3}) q[{b}];")
 
 
 class VQE(Algorithm):
@@ -24,6 +30,8 @@ class VQE(Algorithm):
         The number of parameters for the VQE variational circuit.
     """
 
+    __slots__ = ('layers', 'n', 'num_params', '_rng')
+
     def __init__(self, model, layers: int, seed: int, penalty: float,
                  ansatz: str):
         """
@@ -45,9 +53,9 @@ class VQE(Algorithm):
         super().__init__(model)
         self.layers: int = layers
         self.n: int = 0
-        self.num_params = self.n + (4 * (self.n - 1) * self.layers)
+        self.num_params: int = 0
         self.circuit: str = self.create_circuit(penalty=penalty)
-        np.random.seed(seed)
+        self._rng = np.random.default_rng(seed)
 
     def create_circuit(self, *args, **kwargs) -> str:
         """
@@ -71,6 +79,7 @@ class VQE(Algorithm):
         """
         self.qubo = self.model.get_qubo(penalty=kwargs['penalty'])
         self.n = self.qubo.get_num_binary_vars()
+        self.num_params = self.n + (4 * (self.n - 1) * self.layers)
 
         circuit_lines = [f"input float[64] theta{i};" for i in
                          range(self.num_params)]
@@ -80,50 +89,19 @@ class VQE(Algorithm):
         pc = 0
 
         circuit_lines.extend(
-            [f"ry(param{pc + i}) q[{i}];" for i in range(self.n)])
+            [f"ry(theta{pc + i}) q[{i}];" for i in range(self.n)])
         pc += self.n
 
         for d in range(self.layers):
             for i in range(self.n - 1):
-                circuit_lines.append(f"cx q[{i}], q[{i + 1}];")
-
-                circuit_lines.append(f"ry(param{pc}) q[{i}];")
-                pc += 1
-                circuit_lines.append(f"ry(param{pc}) q[{i + 1}];")
-                pc += 1
+                circuit_lines.append(_PAIR_TEMPLATE.format(
+                    a=i, b=i + 1, p0=pc, p1=pc + 1, p2=pc + 2, p3=pc + 3))
+                pc += 4
 
-                circuit_lines.append(f"cx q[{i}], q[{i + 1}];")
-
-                circuit_lines.append(f"ry(param{pc}) q[{i}];")
-                pc += 1
-                circuit_lines.append(f"ry(param{pc}) q[{i + 1}];")
-                pc += 1
-
-        circuit_lines.extend(
-            [f"measure q[{i}] -> c[{i}];" for i in range(self.n)])
+        circuit_lines.append("c = measure q;")
 
         return "\n".join(circuit_lines)
 
-    def update_params(self, params: np.ndarray) -> str:
-        """
-        Updates the parameters of the VQE circuit.
-
-        The circuit is updated by replacing the placeholder angles with
-        the values provided in the parameter array.
-
-        Parameters
-        ----------
-        params : np.ndarray
-            The new set of parameters for the VQE circuit.
-
-        Returns
-        -------
-        str
-            The updated OpenQASM3 string for the VQE circuit.
-        """
-
-        return replace_params(self.circuit, params)
-
     def get_starting_point(self) -> np.ndarray:
         """
         Defines the starting point for the VQE optimization.
@@ -134,4 +112,4 @@ class VQE(Algorithm):
             An array representing the starting point for VQE, initialized
             with random values.
         """
-        return np.random.rand(self.n + (4 * (self.n - 1) * self.layers))
+        return self._rng.random(self.num_params)
@@ -0,0 +1,59 @@
+from qplex.algorithms import QAOA, VQE
+from qplex.algorithms.base_algorithm import Algorithm
+
+
+def _create_qaoa(model, options) -> QAOA:
+    return QAOA(model, p=options['p'], penalty=options['penalty'],
+                seed=options['seed'])
+
+
+def _create_vqe(model, options) -> VQE:
+    return VQE(model, layers=options['layers'], penalty=options['penalty'],
+               seed=options['seed'], ansatz=options['ansatz'])
+
+
+class AlgorithmFactory:
+    """
+    A factory class for creating gate-based quantum algorithms based on the
+    specified algorithm name.
+    """
+
+    ALGORITHMS = {
+        'qaoa': _create_qaoa,
+        'vqe': _create_vqe
+    }
+
+    @staticmethod
+    def get_algorithm(model, options) -> Algorithm:
+        """
+        Returns the algorithm instance for the algorithm selected in the
+        options.
+
+        Parameters
+        ----------
+        model: Model
+            The optimization model to be solved.
+        options: Options
+            A dictionary containing configuration options, including the
+            algorithm name and its hyperparameters.
+
+        Returns
+        -------
+        Algorithm
+            An instance of the selected algorithm, with its circuit built
+            for the model.
+
+        Raises
+        ------
+        ValueError
+            If the specified algorithm is not recognized.
+        """
+        algorithm = options['algorithm']
+        try:
+            create_algorithm = AlgorithmFactory.ALGORITHMS[algorithm]
+        except KeyError:
+            raise ValueError(f"Unknown algorithm: {algorithm}") from None
+        return create_algorithm(model, options)
+
+
+algorithm_factory = AlgorithmFactory()
@@ -1,6 +1,12 @@
 import re
+from functools import lru_cache
+
 import numpy as np
 
+_PARAMETER_RE = re.compile(r'theta(\d+)')
+_INPUT_DECLARATION_RE = re.compile(r'^input float\[64\][^\n]*\n?',
+                                   re.MULTILINE)
+
 
 def replace_params(circuit: str, params: np.ndarray) -> str:
     """
@@ -51,8 +57,54 @@ def replace_params(circuit: str, params: np.ndarray) -> str:
         "ry(0.5) q[0];\nrz(1.2) q[1];\n"
     """
 
-    def replacer(match):
-        param_index = int(match.group(1))
-        return str(params[param_index])
+    return _parameter_template(circuit).format(*np.asarray(params).tolist())
+
+
+@lru_cache(maxsize=1)
+def _parameter_template(circuit: str) -> str:
+    """
+    Converts a quantum circuit string into a `str.format` template.
+
+    Each 'thetaX' placeholder becomes a '{X}' replacement field (with any
+    literal braces escaped), so binding a set of parameters is a single
+    `format` call. The template of the last circuit is cached, so a circuit
+    that is re-parameterized on every optimizer iteration is only scanned
+    once, while no earlier circuits are kept alive.
+
+    Parameters:
+    ----------
+    circuit : str
+        The quantum circuit as a string with 'thetaX' placeholders.
 
-    return re.sub(r'theta(\d+)', replacer, circuit)
+    Returns:
+    -------
+    str
+        The circuit as a format template indexed by parameter position.
+    """
+    parts = _PARAMETER_RE.split(circuit)
+    fragments = [part.replace('{', '{{').replace('}', '}}')
+                 for part in parts[0::2]]
+    fields = [f'{{{int(index)}}}' for index in parts[1::2]]
+    return ''.join(fragment + field for fragment, field in
+                   zip(fragments, fields)) + fragments[-1]
+
+
+def remove_input_declarations(circuit: str) -> str:
+    """
+    Removes the parameter input declarations from a quantum circuit string.
+
+    Lines declaring parameter inputs (i.e., `input float[64] thetaX;`) are
+    dropped while the placeholders used by the gates are kept, so the
+    circuit can be bound by text substitution with `replace_params`.
+
+    Parameters:
+    ----------
+    circuit : str
+        The quantum circuit as an OpenQASM3 string.
+
+    Returns:
+    -------
+    str
+        The quantum circuit string without its input declarations.
+    """
+    return _INPUT_DECLARATION_RE.sub('', circuit)
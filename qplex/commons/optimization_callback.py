@@ -1,3 +1,6 @@
+import sys
+import threading
+import time
 from typing import Callable, Optional
 import numpy as np
 
@@ -17,7 +20,12 @@ class OptimizationCallback:
     Attributes:
     -----------
     iteration : int
-        Tracks the current iteration count of the optimization process.
+        Tracks the current iteration count of the optimization process,
+        summed over all restarts.
+
+    run_iterations : dict
+        The iteration count of each restart, keyed by its run index, for
+        the calls that identify their run.
 
     user_callback : Optional[Callable[[np.ndarray], None]]
         A user-defined callback function that accepts the current parameters
@@ -25,17 +33,35 @@ class OptimizationCallback:
         at each iteration. This function allows for customized behavior
         during optimization.
 
+    verbose : bool
+        Whether the iteration number and parameters are printed when no
+        user callback is provided. When False, the callback only counts
+        iterations.
+
     Methods:
     --------
-    __call__(xk: np.ndarray):
+    __call__(xk: np.ndarray, run: Optional[int] = None):
         The method called at each iteration during the optimization process.
         It prints the current
         iteration number and parameters, and invokes the user-defined
-        callback if provided.
+        callback if provided. Calls are serialized, so the callback can be
+        shared by concurrent restarts.
+
+    write(text: str):
+        Adds a block of progress output to the buffer.
+
+    flush():
+        Writes any buffered progress output to stdout. The workflows call
+        it once the optimization finishes.
     """
 
+    SEPARATOR = "-" * 50  # For readability
+    FLUSH_EVERY = 32
+    FLUSH_INTERVAL = 1.0  # Seconds between flushes on slow iterations
+
     def __init__(self,
-                 user_callback: Optional[Callable[[np.ndarray], None]] = None):
+                 user_callback: Optional[Callable[[np.ndarray], None]] = None,
+                 verbose: bool = True):
         """
         Initialize the callback class.
 
@@ -47,11 +73,19 @@ class OptimizationCallback:
             parameter vector `xk` as its input. If no function is provided,
             the default behavior
             will just print the iteration number and parameters.
+        verbose : bool
+            Whether to print the iteration number and parameters when no
+            user callback is provided. Defaults to True.
         """
         self.iteration = 0
+        self.run_iterations = {}
         self.user_callback = user_callback
+        self.verbose = verbose
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
 
-    def __call__(self, xk: np.ndarray) -> None:
+    def __call__(self, xk: np.ndarray, run: Optional[int] = None) -> None:
         """
         The method called at each iteration of the optimization process.
 
@@ -60,19 +94,75 @@ class OptimizationCallback:
         xk : array_like
             The current parameter vector at this iteration of the
             optimization process.
+        run : Optional[int]
+            The index of the restart that reached this iteration, when
+            several optimizer runs share this callback. Each run then keeps
+            its own iteration count.
 
         Behavior:
         ---------
-        1. Prints the current iteration number and parameter values.
+        1. Prints the current iteration number and parameter values. The
+        output is buffered and written every `FLUSH_EVERY` iterations, once
+        `FLUSH_INTERVAL` seconds have passed since the last write, or when
+        `flush` is called.
         2. If a user callback is provided, it is invoked with the current
         parameters `xk`.
+        3. If no user callback is provided and `verbose` is False, only the
+        iteration count is updated.
+
+        Calls from concurrent restarts that invoke the user callback or
+        buffer output are handled one at a time, so the user callback is
+        never invoked concurrently. Quiet calls only count the iteration and
+        return before taking the lock or formatting any output.
         """
         self.iteration += 1
-
-        if self.user_callback:
-            self.user_callback(xk)
+        if run is not None:
+            self.run_iterations[run] = self.run_iterations.get(run, 0) + 1
+        if not self.verbose and not self.user_callback:
             return
 
-        print(f"Iteration: {self.iteration}")
-        print(f"Current parameters: {xk}")
-        print("-" * 50)  # For readability
+        with self._lock:
+            if self.user_callback:
+                self.user_callback(xk)
+                return
+
+            if run is None:
+                header = f"Iteration: {self.iteration}"
+            else:
+                header = (f"Restart: {run} "
+                          f"Iteration: {self.run_iterations[run]}")
+            self.write(f"{header}\n"
+                       f"Current parameters: {xk}\n"
+                       f"{self.SEPARATOR}")
+
+    def write(self, text: str) -> None:
+        """
+        Adds a block of progress output to the buffer.
+
+        The buffer is written every `FLUSH_EVERY` blocks, or once
+        `FLUSH_INTERVAL` seconds have passed since the last write. The
+        workflows also write the cost of each evaluation through this
+        method, so cost and iteration lines keep their order.
+
+        Parameters:
+        -----------
+        text : str
+            The output to buffer, without a trailing newline.
+        """
+        with self._lock:
+            self._buffer.append(text)
+            if len(self._buffer) >= self.FLUSH_EVERY or \
+                    time.monotonic() - self._last_flush >= \
+                    self.FLUSH_INTERVAL:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered progress output to stdout in a single call.
+        """
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if buffer:
+                sys.stdout.write("\n".join(buffer) + "\n")
+                sys.stdout.flush()
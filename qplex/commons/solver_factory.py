@@ -1,7 +1,26 @@
-from qplex.solvers import IBMQSolver, DWaveSolver, BraketSolver
-
 from typing import Any
 
+from qplex.model.constants import DWAVE_TOKEN_KEY, IBMQ_TOKEN_KEY
+
+
+def _create_dwave_solver(token, shots, backend, provider_options):
+    from qplex.solvers.dwave_solver import DWaveSolver
+    return DWaveSolver()
+
+
+def _create_ibmq_solver(token, shots, backend, provider_options):
+    from qplex.solvers.ibmq_solver import IBMQSolver
+    return IBMQSolver(token=token, shots=shots, backend=backend,
+                      optimization_level=provider_options.get(
+                          'optimization_level', 1),
+                      simulator_device=provider_options.get(
+                          'simulator_device', 'CPU'))
+
+
+def _create_braket_solver(token, shots, backend, provider_options):
+    from qplex.solvers.braket_solver import BraketSolver
+    return BraketSolver(shots=shots, backend=backend)
+
 
 class SolverFactory:
     """
@@ -10,11 +29,17 @@ class SolverFactory:
     """
 
     PROVIDERS = {
-        'd-wave': 'd-wave_token',
-        'ibmq': 'ibmq_token',
+        'd-wave': DWAVE_TOKEN_KEY,
+        'ibmq': IBMQ_TOKEN_KEY,
         'braket': None
     }
 
+    BUILDERS = {
+        'd-wave': _create_dwave_solver,
+        'ibmq': _create_ibmq_solver,
+        'braket': _create_braket_solver
+    }
+
     @staticmethod
     def get_solver(provider: str, quantum_api_tokens: dict, shots: int,
                    backend: str, provider_options: dict[str, Any]):
@@ -62,18 +87,8 @@ class SolverFactory:
         else:
             token = None
 
-        if provider == 'd-wave':
-            return DWaveSolver()
-
-        if provider == 'ibmq':
-            return IBMQSolver(token=token, shots=shots, backend=backend,
-                              optimization_level=provider_options.get(
-                                  'optimization_level', 1))
-
-        if provider == 'braket':
-            return BraketSolver(shots=shots, backend=backend)
-
-        raise ValueError(f"Unsupported provider: {provider}")
+        return SolverFactory.BUILDERS[provider](token, shots, backend,
+                                                provider_options)
 
 
 solver_factory = SolverFactory()
@@ -1,3 +1,13 @@
+import threading
+
+import numpy as np
+
+from qplex.commons.optimization_callback import OptimizationCallback
+
+# Guards the evaluation count of algorithms shared by concurrent restarts
+_ITERATION_LOCK = threading.Lock()
+
+
 def get_solution_from_counts(model, optimal_counts):
     """
     Extracts the best solution from the optimal parameter counts obtained
@@ -26,29 +36,63 @@ def get_solution_from_counts(model, optimal_counts):
           values (0 or 1) representing the optimal solution.
         - 'objective': The computed objective value of the best solution.
     """
-    best_solution, best_count = max(optimal_counts.items(),
-                                    key=lambda x: x[1])
+    best_solution = max(optimal_counts, key=optimal_counts.__getitem__)
 
-    values = {}
-    for i, var in enumerate(model.iter_variables()):
-        values[var.name] = int(best_solution[i])
+    var_names = [var.name for var in model.iter_variables()]
+    bits = np.frombuffer(best_solution.encode("ascii"), dtype=np.uint8)
+    bits = bits[:len(var_names)].astype(np.int64) - ord("0")
+    values = dict(zip(var_names, bits.tolist()))
 
-    obj_value = 0
-    linear_terms = model.get_objective_expr().iter_terms()
-    quadratic_terms = list(model.get_objective_expr().iter_quad_triplets())
+    (linear_idx, linear_coef,
+     quad_i, quad_j, quad_coef) = _get_objective_index_arrays(model,
+                                                              var_names)
 
-    if len(linear_terms) > 0:
-        for t in linear_terms:
-            obj_value += (values[t[0].name] * t[1])
+    obj_value = 0
+    if linear_idx.size > 0:
+        obj_value += (linear_coef @ bits[linear_idx]).item()
 
-    if len(quadratic_terms) > 0:
-        for t in quadratic_terms:
-            obj_value += (values[t[0].name] * values[t[1].name] * t[2])
+    if quad_i.size > 0:
+        obj_value += (quad_coef @ (bits[quad_i] * bits[quad_j])).item()
 
     solution = {'objective': obj_value, 'solution': values}
     return solution
 
 
+def _get_objective_index_arrays(model, var_names):
+    """
+    Flattens the objective of a model into index and coefficient arrays.
+
+    Parameters
+    ----------
+    model: Model
+        The optimization model whose objective is flattened.
+    var_names: list[str]
+        The names of the model variables, in bitstring order.
+
+    Returns
+    -------
+    tuple
+        The linear variable indices and coefficients, followed by the two
+        variable indices and the coefficient of every quadratic term.
+    """
+    name_to_idx = {name: i for i, name in enumerate(var_names)}
+    objective = model.get_objective_expr()
+
+    linear_terms = list(objective.iter_terms())
+    linear_idx = np.array([name_to_idx[t[0].name] for t in linear_terms],
+                          dtype=np.intp)
+    linear_coef = np.array([t[1] for t in linear_terms])
+
+    quadratic_terms = list(objective.iter_quad_triplets())
+    quad_i = np.array([name_to_idx[t[0].name] for t in quadratic_terms],
+                      dtype=np.intp)
+    quad_j = np.array([name_to_idx[t[1].name] for t in quadratic_terms],
+                      dtype=np.intp)
+    quad_coef = np.array([t[2] for t in quadratic_terms])
+
+    return linear_idx, linear_coef, quad_i, quad_j, quad_coef
+
+
 def calculate_energy(counts, shots, algorithm_instance):
     """
     Calculates the energy (or cost function value) of a quantum solution.
@@ -77,11 +121,32 @@ def calculate_energy(counts, shots, algorithm_instance):
         The average energy (or cost function value) of the quantum solution,
         normalized by the total number of shots.
     """
-    energy = 0
-    for sample, count in counts.items():
-        sample = [int(n) for n in sample]
-        energy += count * algorithm_instance.qubo.objective.evaluate(sample)
+    energies = algorithm_instance.get_sample_energies(list(counts))
+    frequencies = np.fromiter(counts.values(), dtype=np.float64,
+                              count=len(counts))
+
+    with _ITERATION_LOCK:
+        algorithm_instance.iteration += 1
+
+    return float(frequencies @ energies) / shots
+
+
+def print_cost(cost, callback):
+    """
+    Prints the cost of an evaluation in verbose mode.
 
-    algorithm_instance.iteration += 1
+    The cost is buffered by the optimization callback together with its
+    iteration output, so the cost lines and the iteration lines appear in
+    the order they were produced.
 
-    return energy / shots
+    Parameters
+    ----------
+    cost : float
+        The cost (energy) of the evaluated parameters.
+    callback : Callable
+        The optimization callback of the workflow.
+    """
+    if isinstance(callback, OptimizationCallback):
+        callback.write(f'\nCost = {cost}')
+    else:
+        print(f'\nCost = {cost}')
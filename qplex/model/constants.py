@@ -11,6 +11,13 @@ VAR_TYPE = {
     'C': 'REAL'  # Real (continuous) variables
 }
 
+# Keys of the provider API tokens stored in QModel.quantum_api_tokens
+DWAVE_TOKEN_KEY = 'd-wave_token'
+IBMQ_TOKEN_KEY = 'ibmq_token'
+
+# Devices the local Aer simulator of the IBMQ provider can run on
+ALLOWED_SIMULATOR_DEVICES = {'CPU', 'GPU'}
+
 # Allowed optimizers for optimization routines
 ALLOWED_OPTIMIZERS = {
     'Nelder-Mead',  # Nelder-Mead algorithm
@@ -29,3 +36,18 @@ ALLOWED_OPTIMIZERS = {
     'trust-exact',  # Trust Region Exact
     'trust-krylov'  # Trust Region Krylov
 }
+
+# Optimizers that use the gradient of the objective function
+GRADIENT_OPTIMIZERS = {
+    'CG',
+    'BFGS',
+    'Newton-CG',
+    'L-BFGS-B',
+    'TNC',
+    'SLSQP',
+    'trust-constr',
+    'dogleg',
+    'trust-ncg',
+    'trust-exact',
+    'trust-krylov'
+}
@@ -1,6 +1,7 @@
+import warnings
 from collections.abc import MutableMapping
-from qplex.model.constants import ALLOWED_OPTIMIZERS
-from qplex.commons.optimization_callback import OptimizationCallback
+from qplex.model.constants import (ALLOWED_OPTIMIZERS,
+                                   ALLOWED_SIMULATOR_DEVICES)
 
 import numpy as np
 from typing import Callable, Optional
@@ -51,13 +52,23 @@ class Options(MutableMapping):
         Default is "COBYLA". It must be a valid optimizer name or a callable.
     callback : Callable, optional
         A callback function to be called at each iteration of the
-        optimization. Default is an instance of `OptimizationCallback`.
+        optimization. Default is None, in which case each solve creates its
+        own `OptimizationCallback`, which prints the iteration progress only
+        when `verbose` is True.
     tolerance : float, optional
         The tolerance for the optimizer to determine convergence. Default is
         1e-10.
     max_iter : int, optional
         The maximum number of iterations allowed for the optimizer. Default
         is 1000.
+    restarts : int, optional
+        The number of independent optimizer runs, each from its own random
+        starting point. The runs are executed concurrently and the one with
+        the lowest cost is kept. With several restarts the callback is
+        invoked from the worker threads, one call at a time, and an
+        `OptimizationCallback` counts iterations per restart. Only the
+        default workflow supports restarts; the 'ibm_session' workflow warns
+        and runs once. Must be a positive integer. Default is 1.
     penalty : float, optional
         The penalty factor for the QUBO conversion. This parameter is used
         when formulating the problem as a QUBO. Default is None.
@@ -69,8 +80,23 @@ class Options(MutableMapping):
         Default is 1.
     provider_options : dict, optional
         Additional options specific to the quantum provider, such as
-        credentials or backend-specific configurations. Default is an empty
-        dictionary.
+        credentials or backend-specific configurations. Recognized keys
+        are:
+
+        - 'max_workers': the maximum number of circuits submitted
+          concurrently when computing gradients or running restarts. Must
+          be a positive integer. Defaults to 4 on hardware backends, to
+          stay within provider queue and job limits, and to four times the
+          number of CPU cores on local simulators.
+        - 'optimization_level': the Qiskit transpiler optimization level
+          used by the 'ibmq' provider. Default is 1.
+        - 'simulator_device': the device of the local Aer simulator used by
+          the 'ibmq' provider, either 'CPU' or 'GPU'. GPU statevector
+          simulation requires the qiskit-aer-gpu package. It only applies
+          to the 'simulator' backend; setting it for another backend emits
+          a warning. Default is 'CPU'.
+
+        Default is an empty dictionary.
     """
 
     def __init__(self,
@@ -84,10 +110,10 @@ class Options(MutableMapping):
                  p: int = 2,
                  layers: int = 2,
                  optimizer: str = "COBYLA",
-                 callback: Optional[
-                     Callable[[np.ndarray], None]] = OptimizationCallback(),
+                 callback: Optional[Callable[[np.ndarray], None]] = None,
                  tolerance: float = 1e-10,
                  max_iter: int = 1000,
+                 restarts: int = 1,
                  penalty: float = None,
                  shots: int = 1024,
                  seed: int = 1,
@@ -108,6 +134,7 @@ class Options(MutableMapping):
             'callback': callback,
             'tolerance': tolerance,
             'max_iter': max_iter,
+            'restarts': restarts,
             'penalty': penalty,
             'shots': shots,
             'seed': seed,
@@ -115,6 +142,9 @@ class Options(MutableMapping):
         }
 
         self._validate_optimizer()
+        self._validate_restarts()
+        self._validate_max_workers()
+        self._validate_simulator_device()
 
     def __getitem__(self, key):
         """
@@ -208,6 +238,72 @@ class Options(MutableMapping):
                 f"Invalid optimizer: {self._options['optimizer']}. Must be "
                 f"one of {ALLOWED_OPTIMIZERS} or a callable.")
 
+    def _validate_restarts(self):
+        """
+        Validates the restarts option.
+
+        Ensures that the number of restarts is an integer of at least 1.
+
+        Raises
+        ------
+        ValueError
+            If restarts is not a positive integer.
+        """
+        restarts = self._options['restarts']
+        if not isinstance(restarts, int) or isinstance(restarts, bool) or \
+                restarts < 1:
+            raise ValueError(
+                f"Invalid restarts: {restarts!r}. Must be an integer of at "
+                f"least 1.")
+
+    def _validate_max_workers(self):
+        """
+        Validates the 'max_workers' provider option.
+
+        Ensures that, when given, the maximum number of concurrent
+        submissions is an integer of at least 1. A missing or None value
+        selects the solver default.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is given and is not a positive integer.
+        """
+        max_workers = self._options['provider_options'].get('max_workers')
+        if max_workers is None:
+            return
+        if not isinstance(max_workers, int) or \
+                isinstance(max_workers, bool) or max_workers < 1:
+            raise ValueError(
+                f"Invalid max_workers: {max_workers!r}. Must be an integer "
+                f"of at least 1.")
+
+    def _validate_simulator_device(self):
+        """
+        Validates the 'simulator_device' provider option.
+
+        Ensures that, when given, the simulator device is one of the allowed
+        devices. The option only applies to the local simulator, so a
+        warning is emitted when it is set for any other backend.
+
+        Raises
+        ------
+        ValueError
+            If simulator_device is given and is not an allowed device.
+        """
+        device = self._options['provider_options'].get('simulator_device')
+        if device is None:
+            return
+        if device not in ALLOWED_SIMULATOR_DEVICES:
+            raise ValueError(
+                f"Invalid simulator_device: {device!r}. Must be one of "
+                f"{sorted(ALLOWED_SIMULATOR_DEVICES)}.")
+        if self._options['backend'] != 'simulator':
+            warnings.warn("The 'simulator_device' provider option only "
+                          "applies to the 'simulator' backend and is ignored "
+                          f"for backend {self._options['backend']!r}.",
+                          UserWarning, stacklevel=3)
+
     def __repr__(self):
         """
         Returns a string representation of the options.
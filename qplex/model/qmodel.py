@@ -9,6 +9,7 @@ from qplex.commons import solver_factory
 from qplex.commons.workflow_utils import get_solution_from_counts
 from qplex.workflows import ibm_session_workflow, ggaem_workflow
 from qplex.model.options import Options
+from qplex.model.constants import DWAVE_TOKEN_KEY, IBMQ_TOKEN_KEY
 import os
 
 
@@ -30,8 +31,8 @@ class QModel(Model):
         super(QModel, self).__init__(name)
         self.job_id = None
         self.quantum_api_tokens = {
-            'd-wave_token': os.environ.get('D-WAVE_API_TOKEN'),
-            'ibmq_token': os.environ.get('IBMQ_API_TOKEN'),
+            DWAVE_TOKEN_KEY: os.environ.get('D-WAVE_API_TOKEN'),
+            IBMQ_TOKEN_KEY: os.environ.get('IBMQ_API_TOKEN'),
         }
         self.exec_time = 0
         self.method = None
@@ -1,7 +1,22 @@
 """
 This module provides the different solvers.
+
+The solvers are imported lazily on first access, so only the SDK of the
+provider that is actually used gets loaded.
 """
 
-from qplex.solvers.ibmq_solver import IBMQSolver
-from qplex.solvers.dwave_solver import DWaveSolver
-from qplex.solvers.braket_solver import BraketSolver
+from importlib import import_module
+
+_SOLVER_MODULES = {
+    'IBMQSolver': 'qplex.solvers.ibmq_solver',
+    'DWaveSolver': 'qplex.solvers.dwave_solver',
+    'BraketSolver': 'qplex.solvers.braket_solver'
+}
+
+__all__ = list(_SOLVER_MODULES)
+
+
+def __getattr__(name):
+    if name in _SOLVER_MODULES:
+        return getattr(import_module(_SOLVER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,18 @@
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from qplex.commons.circuit_utils import (remove_input_declarations,
+                                         replace_params)
+
+# Default cap on concurrent submissions made by a single batch. Remote
+# backends get a small fixed cap, so that a batch stays within provider
+# queue and job limits; local simulators scale with the available cores.
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_SIMULATOR_MAX_WORKERS = 4 * (os.cpu_count() or 1)
 
 
 class Solver(ABC):
@@ -28,6 +41,74 @@ class Solver(ABC):
         """
         ...
 
+    def solve_parameterized(self, circuit: str, params: np.ndarray) -> Dict:
+        """
+        Solves a parameterized circuit for the given parameter values.
+
+        The circuit declares its parameters as OpenQASM3 inputs (i.e.,
+        `input float[64] thetaX;`). This default implementation binds the
+        values into the circuit text and calls `solve`. Solvers that can
+        compile a circuit once and bind the parameters at execution time
+        override it, so the circuit is not re-parsed on every iteration of
+        a variational optimization.
+
+        Args:
+            circuit: The parameterized quantum circuit as an OpenQASM3
+                     string.
+            params: The values for the circuit parameters, where params[i]
+                    is bound to 'thetai'.
+
+        Returns:
+            A dictionary containing the measurement counts.
+        """
+        return self.solve(
+            replace_params(remove_input_declarations(circuit), params))
+
+    @property
+    def default_max_workers(self) -> int:
+        """
+        The default maximum number of concurrent submissions.
+
+        Returns:
+            DEFAULT_SIMULATOR_MAX_WORKERS when the solver runs on a local
+            simulator, and DEFAULT_MAX_WORKERS otherwise.
+        """
+        if getattr(self, 'backend', None) == 'simulator':
+            return DEFAULT_SIMULATOR_MAX_WORKERS
+        return DEFAULT_MAX_WORKERS
+
+    def batch_solve_parameterized(self, circuit: str, params_batch: List,
+                                  max_workers: Optional[int] = None
+                                  ) -> List[Dict]:
+        """
+        Solves a parameterized circuit for several parameter vectors
+        concurrently.
+
+        Each parameter vector is passed to `solve_parameterized` on a worker
+        thread, so evaluations that are independent of each other (e.g.,
+        the points of a finite-difference gradient) overlap instead of
+        adding up.
+
+        Args:
+            circuit: The parameterized quantum circuit as an OpenQASM3
+                     string.
+            params_batch: The parameter vectors to be bound to the circuit.
+            max_workers: The maximum number of concurrent submissions.
+                         Defaults to `default_max_workers`, and never
+                         exceeds the number of parameter vectors.
+
+        Returns:
+            The measurement counts, in the same order as `params_batch`.
+        """
+        if len(params_batch) == 0:
+            return []
+        max_workers = min(len(params_batch),
+                          max_workers or self.default_max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda params: self.solve_parameterized(circuit, params),
+                params_batch))
+
     @abstractmethod
     def parse_input(self, input_form) -> Any:
         """
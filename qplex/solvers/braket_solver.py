@@ -1,4 +1,6 @@
+import threading
 from typing import Any
+import numpy as np
 from braket.aws import AwsDevice
 from qplex.solvers.base_solver import Solver
 from braket.ir.openqasm import Program as OpenQASMProgram
@@ -17,6 +19,10 @@ class BraketSolver(Solver):
     backend : str
         The name of the backend to be used, which can be a Braket
         device or a local simulator.
+    compiled_circuit : tuple or None
+        The last parameterized circuit string prepared by
+        `solve_parameterized`, together with its backend and OpenQASM
+        source, reused while the same circuit keeps being solved.
     """
 
     def __init__(self, shots: int, backend: str):
@@ -34,6 +40,8 @@ class BraketSolver(Solver):
         """
         self.shots = shots
         self.backend = backend
+        self.compiled_circuit = None
+        self._compile_lock = threading.Lock()
 
     def solve(self, model: str) -> dict:
         """
@@ -55,6 +63,45 @@ class BraketSolver(Solver):
         counts = self.parse_response(response)
         return counts
 
+    def solve_parameterized(self, circuit: str, params: np.ndarray) -> dict:
+        """
+        Solves a parameterized circuit for the given parameter values.
+
+        The circuit source and the backend are prepared only the first time
+        the circuit is received; subsequent calls pass the new parameter
+        values as OpenQASM3 program inputs instead of rewriting the
+        circuit text. Concurrent callers receiving a new circuit wait for
+        a single preparation.
+
+        Parameters
+        ----------
+        circuit : str
+            The parameterized quantum circuit as an OpenQASM string, with
+            its parameters declared as inputs.
+        params : np.ndarray
+            The values for the circuit parameters, where params[i] is bound
+            to 'thetai'.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the measurement counts from the backend.
+        """
+        compiled_circuit = self.compiled_circuit
+        if compiled_circuit is None or compiled_circuit[0] != circuit:
+            with self._compile_lock:
+                compiled_circuit = self.compiled_circuit
+                if compiled_circuit is None or compiled_circuit[0] != circuit:
+                    compiled_circuit = (circuit, self.select_backend(0),
+                                        self.parse_input(circuit).source)
+                    self.compiled_circuit = compiled_circuit
+        _, backend, source = compiled_circuit
+        inputs = {f'theta{i}': value
+                  for i, value in enumerate(np.asarray(params).tolist())}
+        qc = OpenQASMProgram(source=source, inputs=inputs)
+        response = backend.run(qc, shots=self.shots).result()
+        return self.parse_response(response)
+
     def parse_input(self, circuit: str) -> OpenQASMProgram:
         """
         Converts a circuit string to an OpenQASMProgram, replacing 'cx' with
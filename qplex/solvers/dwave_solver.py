@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from qplex.model.constants import VAR_TYPE
+from qplex.model.constants import VAR_TYPE, DWAVE_TOKEN_KEY
 from dwave.system import (LeapHybridCQMSampler, LeapHybridBQMSampler,
                           LeapHybridDQMSampler, )
 from dimod import (ConstrainedQuadraticModel, QuadraticModel,
@@ -32,7 +32,7 @@ class DWaveSolver(Solver):
             A dictionary containing the solution with 'objective' and
             'solution' keys.
         """
-        token = model.quantum_api_tokens.get("d-wave_token")
+        token = model.quantum_api_tokens.get(DWAVE_TOKEN_KEY)
         parsed_model, model_type = self.parse_input(model)
 
         if model_type == VAR_TYPE['C']:
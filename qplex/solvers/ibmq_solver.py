@@ -1,3 +1,5 @@
+import threading
+import numpy as np
 from qiskit.qasm3 import loads
 from qiskit import QuantumCircuit
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
@@ -24,10 +26,17 @@ class IBMQSolver(Solver):
         backend.
     optimization_level : int
         The desired optimization level for the Qiskit circuit.
+    simulator_device : str
+        The device used by the local Aer simulator ('CPU' or 'GPU'). GPU
+        statevector simulation requires the qiskit-aer-gpu package.
+    compiled_circuit : tuple or None
+        The last parameterized circuit string compiled by
+        `solve_parameterized`, together with its backend and transpiled
+        circuit, reused while the same circuit keeps being solved.
     """
 
     def __init__(self, token: str, shots: int, backend: str,
-                 optimization_level: int):
+                 optimization_level: int, simulator_device: str = 'CPU'):
         """
         Initializes the IBMQSolver with the specified token, number of
         shots, and backend.
@@ -43,6 +52,9 @@ class IBMQSolver(Solver):
             which can be an IBMQ device or a local simulator.
         optimization_level : int
             The desired optimization level for the Qiskit circuit.
+        simulator_device : str, optional
+            The device used by the local Aer simulator ('CPU' or 'GPU').
+            Default is 'CPU'.
         """
         self.shots = shots
         self.backend = backend
@@ -52,6 +64,9 @@ class IBMQSolver(Solver):
                                           token=token, overwrite=True)
         self.service = QiskitRuntimeService()
         self.optimization_level = optimization_level
+        self.simulator_device = simulator_device
+        self.compiled_circuit = None
+        self._compile_lock = threading.Lock()
 
     def solve(self, model: str) -> dict:
         """
@@ -69,13 +84,85 @@ class IBMQSolver(Solver):
             A dictionary containing the measurement counts from the
             backend.
         """
-        qc = self.parse_input(model)
+        backend, isa_circuit = self.compile(model)
+        return self.execute(isa_circuit, backend)
+
+    def solve_parameterized(self, circuit: str, params: np.ndarray) -> dict:
+        """
+        Solves a parameterized circuit for the given parameter values.
+
+        The circuit is parsed and transpiled only the first time it is
+        received; subsequent calls with the same circuit bind the new
+        parameter values to the cached transpiled circuit. Concurrent
+        callers receiving a new circuit wait for a single compilation.
+
+        Parameters
+        ----------
+        circuit : str
+            The parameterized quantum circuit as an OpenQASM string, with
+            its parameters declared as inputs.
+        params : np.ndarray
+            The values for the circuit parameters, where params[i] is bound
+            to 'thetai'.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the measurement counts from the
+            backend.
+        """
+        compiled_circuit = self.compiled_circuit
+        if compiled_circuit is None or compiled_circuit[0] != circuit:
+            with self._compile_lock:
+                compiled_circuit = self.compiled_circuit
+                if compiled_circuit is None or compiled_circuit[0] != circuit:
+                    compiled_circuit = (circuit, *self.compile(circuit))
+                    self.compiled_circuit = compiled_circuit
+        _, backend, isa_circuit = compiled_circuit
+        params_dict = {f'theta{i}': params[i] for i in range(len(params))}
+        return self.execute(isa_circuit.assign_parameters(params_dict),
+                            backend)
+
+    def compile(self, circuit: str) -> tuple[AerSimulator | BackendV2,
+                                             QuantumCircuit]:
+        """
+        Parses a circuit string and transpiles it for the selected backend.
+
+        Parameters
+        ----------
+        circuit : str
+            The quantum circuit as an OpenQASM string.
+
+        Returns
+        -------
+        tuple
+            The selected backend and the transpiled circuit.
+        """
+        qc = self.parse_input(circuit)
         backend = self.select_backend(qc.num_qubits)
         pass_manager = generate_preset_pass_manager(backend=backend,
                                                     optimization_level=
                                                     self.optimization_level)
-        isa_circuit = pass_manager.run(qc)
+        return backend, pass_manager.run(qc)
+
+    def execute(self, isa_circuit: QuantumCircuit,
+                backend: AerSimulator | BackendV2) -> dict:
+        """
+        Executes a transpiled circuit on the given backend.
 
+        Parameters
+        ----------
+        isa_circuit : QuantumCircuit
+            The transpiled circuit, with all of its parameters bound.
+        backend : AerSimulator | BackendV2
+            The backend to run the circuit on.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the measurement counts from the
+            backend.
+        """
         if self.backend == 'simulator':
             raw_counts = backend.run(isa_circuit).result().get_counts()
         else:
@@ -153,4 +240,4 @@ class IBMQSolver(Solver):
             if self.backend is None or self.backend == "":
                 return self.service.least_busy(min_num_qubits=qubits)
             return self.service.backend(self.backend)
-        return AerSimulator()
+        return AerSimulator(device=self.simulator_device)
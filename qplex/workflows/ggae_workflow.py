@@ -1,16 +1,36 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+
 from scipy.optimize import minimize
-from qplex.algorithms import QAOA, VQE
+from qplex.commons.algorithm_factory import algorithm_factory
+from qplex.commons.optimization_callback import OptimizationCallback
 from qplex.solvers.base_solver import Solver
-from qplex.commons.workflow_utils import calculate_energy
+from qplex.commons.workflow_utils import calculate_energy, print_cost
+from qplex.model.constants import GRADIENT_OPTIMIZERS
 
 import numpy as np
 
+# Relative finite-difference step, matching SciPy's default 2-point scheme
+FINITE_DIFFERENCE_STEP = np.sqrt(np.finfo(np.float64).eps)
+
+# Number of distinct parameter vectors whose cost is remembered per run
+COST_CACHE_SIZE = 256
+
 
 def ggaem_workflow(model, solver: Solver, options):
     """
     Runs the GGAEM (Generalized Gate-Based Algorithm Execution Manager)
     workflow.
 
+    With `restarts` greater than one, that many optimizer runs are started
+    from independent random starting points and executed concurrently on
+    a thread pool. The run with the lowest final cost (`result.fun`) is
+    kept, and its optimal parameters are used for the final execution.
+    Each run gets its own callback: an `OptimizationCallback` is bound to
+    the run index, so it counts iterations per restart, and any other
+    callable is wrapped so that it is never invoked concurrently.
+
     Parameters
     ----------
     model: Model
@@ -26,25 +46,24 @@ def ggaem_workflow(model, solver: Solver, options):
         A dictionary of optimal parameter counts.
     """
     shots = options['shots']
-    algorithm = options['algorithm']
-    penalty = options['penalty']
-    seed = options['seed']
     verbose = options['verbose']
     optimizer = options['optimizer']
     callback = options['callback']
+    if callback is None:
+        callback = OptimizationCallback(verbose=verbose)
     max_iter = options['max_iter']
     tolerance = options['tolerance']
+    restarts = options['restarts']
+    # Concurrent restarts share the submission budget of the provider: at
+    # most `budget` runs execute at once, and the gradient batches of each
+    # run get an equal share of the budget (at least one submission), so
+    # the total number of concurrent submissions stays close to `budget`.
+    budget = options['provider_options'].get('max_workers') or \
+        solver.default_max_workers
+    concurrent_runs = min(restarts, budget)
+    max_workers = max(1, budget // concurrent_runs)
 
-    algorithm_instance = None
-    if algorithm == "qaoa":
-        algorithm_instance = QAOA(model, p=options['p'], penalty=penalty,
-                                  seed=seed)
-    elif algorithm == "vqe":
-        algorithm_instance = VQE(model, layers=options['layers'],
-                                 penalty=penalty,
-                                 seed=seed, ansatz=options['ansatz'])
-
-    algorithm_instance.remove_parameters()
+    algorithm_instance = algorithm_factory.get_algorithm(model, options)
 
     def cost_function(params: np.ndarray) -> float:
         """
@@ -52,7 +71,8 @@ def ggaem_workflow(model, solver: Solver, options):
         routine.
 
         This method calculates the cost based on the given parameters by
-        updating the quantum circuit, solving it, and evaluating the energy.
+        binding them to the quantum circuit, solving it, and evaluating the
+        energy.
 
         Parameters
         ----------
@@ -64,21 +84,132 @@ def ggaem_workflow(model, solver: Solver, options):
         float
             The cost for the current parameters.
         """
-        qc = algorithm_instance.update_params(params)
-        counts = solver.solve(qc)
+        counts = solver.solve_parameterized(algorithm_instance.circuit, params)
         cost = calculate_energy(counts, shots, algorithm_instance)
         if verbose:
-            print(f'\nCost = {cost}')
+            print_cost(cost, callback)
         return cost
 
-    starting_point = algorithm_instance.get_starting_point()
-    optimization_result = minimize(fun=cost_function,
-                                   x0=starting_point, method=optimizer,
-                                   callback=callback,
-                                   tol=tolerance,
-                                   options={'maxiter': max_iter})
+    @lru_cache(maxsize=COST_CACHE_SIZE)
+    def cached_cost_function(params_bytes: bytes) -> float:
+        """
+        Memoizes the cost function on the raw bytes of the parameters.
+
+        Derivative-free optimizers such as COBYLA may evaluate the same
+        parameter vector more than once, and gradient-based optimizers ask
+        for the gradient at a point whose cost they just evaluated; repeated
+        points are answered from the cache instead of executing the circuit
+        again.
+
+        Parameters
+        ----------
+        params_bytes : bytes
+            The float64 parameter vector, as returned by `ndarray.tobytes`.
+
+        Returns
+        -------
+        float
+            The cost for the given parameters.
+        """
+        return cost_function(np.frombuffer(params_bytes, dtype=np.float64))
+
+    def fun(params: np.ndarray) -> float:
+        return cached_cost_function(
+            np.asarray(params, dtype=np.float64).tobytes())
+
+    def gradient(params: np.ndarray) -> np.ndarray:
+        """
+        Computes the forward-difference gradient of the cost function for
+        gradient-based optimizers.
+
+        The cost at `params` is taken from the cost cache, since optimizers
+        evaluate it before asking for the gradient. The shifted points (one
+        per parameter) are independent, so they are submitted to the solver
+        as a single concurrent batch instead of one at a time. In verbose
+        mode their costs are printed like any other evaluation.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            The new set of parameters for the circuit.
+
+        Returns
+        -------
+        np.ndarray
+            The gradient of the cost for the current parameters.
+        """
+        params = np.asarray(params, dtype=np.float64)
+        cost = fun(params)
+        steps = FINITE_DIFFERENCE_STEP * np.where(params >= 0, 1.0, -1.0) \
+            * np.maximum(1.0, np.abs(params))
+        shifted = params + np.diag(steps)
+        steps = np.diag(shifted) - params
+
+        counts_batch = solver.batch_solve_parameterized(
+            algorithm_instance.circuit, list(shifted),
+            max_workers=max_workers)
+        costs = np.array([calculate_energy(counts, shots, algorithm_instance)
+                          for counts in counts_batch])
+        if verbose:
+            for shifted_cost in costs:
+                print_cost(shifted_cost, callback)
+        return (costs - cost) / steps
+
+    jac = gradient if optimizer in GRADIENT_OPTIMIZERS else None
+
+    callback_lock = threading.Lock()
+
+    def run_callback(run: int):
+        """
+        Returns the callback for one of several concurrent restarts.
+
+        An OptimizationCallback keeps a separate iteration count for each
+        run and serializes its calls itself; any other callable is wrapped
+        so that it is never invoked concurrently.
+
+        Parameters
+        ----------
+        run : int
+            The index of the restart.
+
+        Returns
+        -------
+        Callable
+            The callback to pass to the optimizer for this run.
+        """
+        if isinstance(callback, OptimizationCallback):
+            return partial(callback, run=run)
+
+        def serialized_callback(xk: np.ndarray):
+            with callback_lock:
+                return callback(xk)
+
+        return serialized_callback
+
+    def optimize(starting_point: np.ndarray, run_cb=callback):
+        return minimize(fun=fun, jac=jac,
+                        x0=starting_point, method=optimizer,
+                        callback=run_cb,
+                        tol=tolerance,
+                        options={'maxiter': max_iter})
+
+    starting_points = [algorithm_instance.get_starting_point()
+                       for _ in range(restarts)]
+    try:
+        if restarts > 1:
+            with ThreadPoolExecutor(max_workers=concurrent_runs) as executor:
+                results = list(executor.map(
+                    optimize, starting_points,
+                    [run_callback(run) for run in range(restarts)]))
+        else:
+            results = [optimize(starting_points[0])]
+    finally:
+        if isinstance(callback, OptimizationCallback):
+            callback.flush()
+
+    optimization_result = min(results, key=lambda result: result.fun)
     optimal_params = optimization_result.x
-    qc = algorithm_instance.update_params(optimal_params)
-    opt_counts = solver.solve(qc)
+    opt_counts = solver.solve_parameterized(algorithm_instance.circuit,
+                                            optimal_params)
 
     return opt_counts
@@ -1,9 +1,12 @@
+import warnings
+
 from qiskit_ibm_runtime import (SamplerV2 as Sampler, Session)
 from scipy.optimize import minimize
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 
-from qplex.algorithms import QAOA, VQE
-from qplex.commons.workflow_utils import calculate_energy
+from qplex.commons.algorithm_factory import algorithm_factory
+from qplex.commons.optimization_callback import OptimizationCallback
+from qplex.commons.workflow_utils import calculate_energy, print_cost
 
 
 def ibm_session_workflow(model, ibmq_solver, options):
@@ -26,25 +29,21 @@ def ibm_session_workflow(model, ibmq_solver, options):
         A dictionary representing the optimal measurement results (bitstring
         counts) obtained after optimizing the quantum circuit's parameters.
     """
-    algorithm = options['algorithm']
-    penalty = options['penalty']
-    seed = options['seed']
     verbose = options['verbose']
     optimizer = options['optimizer']
     callback = options['callback']
+    if callback is None:
+        callback = OptimizationCallback(verbose=verbose)
     max_iter = options['max_iter']
     tolerance = options['tolerance']
 
-    service = ibmq_solver.service
-    algorithm_instance = None
+    if options['restarts'] > 1:
+        warnings.warn("The 'restarts' option is not supported by the "
+                      "ibm_session workflow; running a single optimization.",
+                      UserWarning, stacklevel=2)
 
-    if algorithm == "qaoa":
-        algorithm_instance = QAOA(model, p=options['p'], penalty=penalty,
-                                  seed=seed)
-    elif algorithm == "vqe":
-        algorithm_instance = VQE(model, layers=options['layers'],
-                                 penalty=penalty, seed=seed,
-                                 ansatz=options['ansatz'])
+    service = ibmq_solver.service
+    algorithm_instance = algorithm_factory.get_algorithm(model, options)
 
     vqc = ibmq_solver.parse_input(algorithm_instance.circuit)
     backend = ibmq_solver.select_backend(vqc.num_qubits)
@@ -73,18 +72,22 @@ def ibm_session_workflow(model, ibmq_solver, options):
         counts = compute_counts(params, ibmq_solver, isa_circuit, sampler)
         cost = calculate_energy(counts, ibmq_solver.shots, algorithm_instance)
         if verbose:
-            print(f'\nCost = {cost}')
+            print_cost(cost, callback)
         return cost
 
     with Session(service=service, backend=backend) as session:
         sampler = Sampler(mode=session)
 
-        optimization_result = minimize(fun=cost_function,
-                                       x0=starting_point,
-                                       method=optimizer,
-                                       tol=tolerance,
-                                       callback=callback,
-                                       options={'maxiter': max_iter})
+        try:
+            optimization_result = minimize(fun=cost_function,
+                                           x0=starting_point,
+                                           method=optimizer,
+                                           tol=tolerance,
+                                           callback=callback,
+                                           options={'maxiter': max_iter})
+        finally:
+            if isinstance(callback, OptimizationCallback):
+                callback.flush()
 
         optimal_params = optimization_result.x
 
@@ -0,0 +1,106 @@
+import numpy as np
+
+from qplex.commons.optimization_callback import OptimizationCallback
+from qplex.commons.workflow_utils import print_cost
+from qplex.model.options import Options
+from qplex.workflows import ggae_workflow
+
+
+class _Unformattable:
+    """A parameter vector that fails the test if it is ever formatted."""
+
+    def __format__(self, format_spec):
+        raise AssertionError("the parameters were formatted")
+
+    def __repr__(self):
+        raise AssertionError("the parameters were formatted")
+
+
+class _FakeAlgorithm:
+    circuit = "circuit"
+    iteration = 0
+
+    def get_starting_point(self):
+        return np.array([0.5, -0.5])
+
+    def get_sample_energies(self, bitstrings):
+        return np.array([float(bitstring.count("1"))
+                         for bitstring in bitstrings])
+
+
+class _FakeSolver:
+    default_max_workers = 4
+
+    def solve_parameterized(self, circuit, params):
+        ones = int(1024 * np.sin(np.sum(params)) ** 2)
+        return {"00": 1024 - ones, "11": ones}
+
+
+def test_quiet_callback_formats_nothing(capsys):
+    callback = OptimizationCallback(verbose=False)
+
+    callback(_Unformattable())
+    callback(_Unformattable(), run=0)
+
+    assert callback.iteration == 2
+    assert callback.run_iterations == {0: 1}
+    assert callback._buffer == []
+    assert capsys.readouterr().out == ""
+
+
+def test_quiet_solve_formats_nothing(monkeypatch, capsys):
+    callbacks = []
+
+    class RecordingCallback(OptimizationCallback):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            callbacks.append(self)
+
+    monkeypatch.setattr(ggae_workflow, "OptimizationCallback",
+                        RecordingCallback)
+    monkeypatch.setattr(ggae_workflow.algorithm_factory, "get_algorithm",
+                        lambda model, options: _FakeAlgorithm())
+
+    options = Options(method="quantum", max_iter=5)
+    ggae_workflow.ggaem_workflow(None, _FakeSolver(), options)
+
+    assert options["callback"] is None
+    assert len(callbacks) == 1
+    assert not callbacks[0].verbose
+    assert callbacks[0].iteration > 0
+    assert callbacks[0]._buffer == []
+    assert capsys.readouterr().out == ""
+
+
+def test_each_solve_gets_its_own_callback(monkeypatch):
+    callbacks = []
+
+    class RecordingCallback(OptimizationCallback):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            callbacks.append(self)
+
+    monkeypatch.setattr(ggae_workflow, "OptimizationCallback",
+                        RecordingCallback)
+    monkeypatch.setattr(ggae_workflow.algorithm_factory, "get_algorithm",
+                        lambda model, options: _FakeAlgorithm())
+
+    options = Options(method="quantum", max_iter=5)
+    ggae_workflow.ggaem_workflow(None, _FakeSolver(), options)
+    ggae_workflow.ggaem_workflow(None, _FakeSolver(), options)
+
+    assert len(callbacks) == 2
+    assert callbacks[0] is not callbacks[1]
+
+
+def test_cost_lines_are_buffered_in_order(capsys):
+    callback = OptimizationCallback(verbose=True)
+    callback.FLUSH_INTERVAL = float("inf")
+
+    callback(np.array([0.5]))
+    print_cost(1.5, callback)
+    assert capsys.readouterr().out == ""
+
+    callback.flush()
+    out = capsys.readouterr().out
+    assert out.index("Iteration: 1") < out.index("Cost = 1.5")